@@ -1,18 +1,22 @@
 import requests
 import json
 from collections import Counter
-from schema_analyzer import SchemaAnalyzer
+from itertools import chain
+from schema_analyzer import fetch_schema
 import time
 from functools import lru_cache
 import os
 import random
 import logging
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Iterator, List, Dict, Any, Optional, Tuple
 
 # Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Shared across analyzer instances so SERP and page fetches reuse pooled connections
+_SESSION = requests.Session()
+
 class CompetitorAnalyzer:
     # List of user agents to rotate through
     USER_AGENTS = [
@@ -61,11 +65,11 @@ class CompetitorAnalyzer:
                 if hasattr(e, 'response'):
                     status_code = e.response.status_code if e.response else None
                     if status_code == 403:
-                        logger.warning(f"Received 403 error, retrying with different user agent in {delay} seconds")
+                        logger.warning("Received 403 error, retrying with different user agent in %s seconds", delay)
                     elif status_code == 429:
-                        logger.warning(f"Rate limit exceeded, retrying in {delay} seconds")
+                        logger.warning("Rate limit exceeded, retrying in %s seconds", delay)
                     else:
-                        logger.warning(f"Request failed with status {status_code}, retrying in {delay} seconds")
+                        logger.warning("Request failed with status %s, retrying in %s seconds", status_code, delay)
                 
                 time.sleep(delay)
                 delay *= 2  # Exponential backoff
@@ -87,7 +91,7 @@ class CompetitorAnalyzer:
         
         try:
             def make_request():
-                response = requests.get('https://api.valueserp.com/search', params=params)
+                response = _SESSION.get('https://api.valueserp.com/search', params=params)
                 response.raise_for_status()
                 return response.json()
             
@@ -106,75 +110,93 @@ class CompetitorAnalyzer:
                     error_msg = "Invalid API key"
                 elif e.response.status_code == 429:
                     error_msg = "Rate limit exceeded"
-            logger.error(f"Error fetching competitor URLs: {error_msg}")
+            logger.error("Error fetching competitor URLs: %s", error_msg)
             raise Exception(f"Error fetching competitor URLs: {error_msg}")
             
-    def analyze_competitors(self, progress_callback=None) -> Dict[str, Any]:
-        """Analyze schema markup from competitor URLs with progress tracking"""
+    def _analyze_url(self, url: str) -> Dict[str, Any]:
+        """Fetch a single competitor URL and extract its schema markup"""
+        def analyze_url():
+            # Single fetch per attempt; a fresh user agent is only used on a cache miss
+            return fetch_schema(url, _user_agent=self._get_random_user_agent())
+
+        return self._retry_with_backoff(analyze_url)
+
+    def iter_competitors(self, max_workers: int = 5) -> Iterator[Tuple[int, int, str, Optional[Dict[str, Any]]]]:
+        """
+        Analyze competitor URLs concurrently, yielding each result as it completes.
+
+        Args:
+            max_workers: Maximum number of competitor pages fetched at once
+
+        Yields:
+            Tuples of (completed count, total URLs, URL, schema data); schema data is
+            None when the URL was skipped, with the reason recorded in skipped_urls
+        """
         competitor_urls = self.get_competitor_urls()
         total_urls = len(competitor_urls)
-        successful_analyses = 0
-        
-        for idx, url in enumerate(competitor_urls, 1):
-            try:
-                if progress_callback:
-                    progress_callback(idx / total_urls)
-                    
-                def analyze_url():
-                    headers = {'User-Agent': self._get_random_user_agent()}
-                    response = requests.get(url, headers=headers, timeout=10)
-                    response.raise_for_status()
-                    analyzer = SchemaAnalyzer(url)
-                    return analyzer.extract_schema()
-                
-                schema_data = self._retry_with_backoff(analyze_url)
+        if not total_urls:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, total_urls)) as executor:
+            futures = {executor.submit(self._analyze_url, url): url for url in competitor_urls}
+
+            for idx, future in enumerate(as_completed(futures), 1):
+                url = futures[future]
+                try:
+                    schema_data = future.result()
+                except Exception as e:
+                    error_msg = str(e)
+                    logger.error("Error analyzing %s: %s", url, error_msg)
+
+                    # Track skipped URLs and reasons
+                    if "403" in error_msg:
+                        reason = "Access forbidden - Website blocks automated access"
+                    elif "404" in error_msg:
+                        reason = "Page not found"
+                    elif "timeout" in error_msg.lower():
+                        reason = "Request timed out"
+                    else:
+                        reason = f"Error: {error_msg}"
+
+                    self.skipped_urls[url] = reason
+                    yield idx, total_urls, url, None
+                    continue
+
                 self.competitor_data[url] = schema_data
+                yield idx, total_urls, url, schema_data
+
+    def analyze_competitors(self, progress_callback=None) -> Dict[str, Any]:
+        """Analyze schema markup from competitor URLs with progress tracking"""
+        total_urls = 0
+        successful_analyses = 0
+
+        for idx, total_urls, url, schema_data in self.iter_competitors():
+            if schema_data is not None:
                 successful_analyses += 1
-                
-                # Rate limit between competitor analysis
-                time.sleep(1)
-                
-            except Exception as e:
-                error_msg = str(e)
-                logger.error(f"Error analyzing {url}: {error_msg}")
-                
-                # Track skipped URLs and reasons
-                if "403" in error_msg:
-                    reason = "Access forbidden - Website blocks automated access"
-                elif "404" in error_msg:
-                    reason = "Page not found"
-                elif "timeout" in error_msg.lower():
-                    reason = "Request timed out"
-                else:
-                    reason = f"Error: {error_msg}"
-                
-                self.skipped_urls[url] = reason
-                continue
-                
+            if progress_callback:
+                progress_callback(idx / total_urls)
+
         if successful_analyses == 0:
             logger.warning("No competitor analyses were successful")
+            if total_urls:
+                # Raise rather than return an empty result so callers' caches don't keep it
+                raise Exception(
+                    f"Could not analyze any of the {total_urls} competitor URLs; "
+                    f"first error: {next(iter(self.skipped_urls.values()), 'unknown')}"
+                )
         else:
-            logger.info(f"Successfully analyzed {successful_analyses}/{total_urls} competitor URLs")
+            logger.info("Successfully analyzed %s/%s competitor URLs", successful_analyses, total_urls)
             
         return self.competitor_data
         
+    def _count_schema_types(self) -> Counter:
+        """Count how many competitor sites use each schema type"""
+        return Counter(chain.from_iterable(schemas.keys() for schemas in self.competitor_data.values()))
+
     def get_schema_usage_stats(self) -> List[Dict[str, Any]]:
         """Get statistics about schema usage among competitors"""
-        schema_types = []
-        total_sites = len(self.competitor_data)
-        
-        # Count unique schema types per site
-        site_schemas = {}
-        for url, schemas in self.competitor_data.items():
-            site_schemas[url] = set(schemas.keys())
-            schema_types.extend(schemas.keys())
-        
-        # Calculate usage counts
-        usage_counts = {}
-        for schema_type in set(schema_types):
-            count = sum(1 for site_schemas in site_schemas.values() if schema_type in site_schemas)
-            usage_counts[schema_type] = count
-        
+        usage_counts = self._count_schema_types()
+
         # Return stats with counts only
         stats = [
             {
@@ -190,13 +212,8 @@ class CompetitorAnalyzer:
     def get_competitor_insights(self) -> List[Dict[str, Any]]:
         """Get detailed insights about competitor schema usage"""
         insights = []
-        schema_types = []
-        
-        for url, schemas in self.competitor_data.items():
-            schema_types.extend(schemas.keys())
-            
         total_competitors = len(self.competitor_data)
-        usage_counts = Counter(schema_types)
+        usage_counts = self._count_schema_types()
         
         for schema_type, count in usage_counts.most_common():
             usage_percentage = (count / total_competitors) * 100 if total_competitors > 0 else 0
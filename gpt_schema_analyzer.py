@@ -4,14 +4,46 @@ from typing import Dict, List, Any, Optional, Union
 import json
 import time
 from functools import lru_cache
+from types import MappingProxyType
 import logging
 import backoff
 from google.api_core import retry
 
 # Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Prompt text shared by every analysis; only the schema data is filled in per call
+_BASE_ANALYSIS_PROMPT = """Analyze the following schema.org markup and provide a detailed response:
+{schema_data}
+
+Focus on the following aspects:
+1. Completeness of implementation
+2. Conformance to Schema.org standards
+3. Potential for rich results
+4. SEO impact
+
+"""
+
+_ANALYSIS_INSTRUCTIONS = MappingProxyType({
+    'documentation': """Compare this implementation against Google's official documentation and Schema.org specifications:
+1. List all missing required properties
+2. Identify recommended but optional properties
+3. Point out any non-standard implementations
+4. Suggest specific improvements""",
+
+    'competitors': """Analyze this schema implementation from a competitive perspective:
+1. Identify unique approaches
+2. List commonly used properties by competitors
+3. Highlight potential competitive advantages
+4. Suggest improvements based on industry standards""",
+
+    'recommendations': """Generate specific recommendations for improving this schema markup:
+1. Priority improvements for SEO impact
+2. Changes needed for rich result eligibility
+3. Advanced property implementations
+4. Best practices and optimization tips"""
+})
+
 class GPTSchemaAnalyzer:
     def __init__(self):
         self.api_key = os.environ.get('GOOGLE_API_KEY')
@@ -38,46 +70,16 @@ class GPTSchemaAnalyzer:
             else:
                 raise ValueError(f"Unsupported data type: {type(data)}. Expected dict or valid JSON string.")
         except json.JSONDecodeError as e:
-            logger.error(f"JSON conversion error: Invalid JSON format - {str(e)}")
+            logger.error("JSON conversion error: Invalid JSON format - %s", e)
             return None
         except Exception as e:
-            logger.error(f"Error converting data to JSON: {type(data)} - {str(e)}")
+            logger.error("Error converting data to JSON: %s - %s", type(data), e)
             return None
         
     def _create_analysis_prompt(self, schema_data: str, analysis_type: str) -> str:
         """Create prompts for different types of analysis with improved context"""
-        base_prompt = f"""Analyze the following schema.org markup and provide a detailed response:
-{schema_data}
-
-Focus on the following aspects:
-1. Completeness of implementation
-2. Conformance to Schema.org standards
-3. Potential for rich results
-4. SEO impact
-
-"""
-        
-        prompts = {
-            'documentation': base_prompt + """Compare this implementation against Google's official documentation and Schema.org specifications:
-1. List all missing required properties
-2. Identify recommended but optional properties
-3. Point out any non-standard implementations
-4. Suggest specific improvements""",
-
-            'competitors': base_prompt + """Analyze this schema implementation from a competitive perspective:
-1. Identify unique approaches
-2. List commonly used properties by competitors
-3. Highlight potential competitive advantages
-4. Suggest improvements based on industry standards""",
-
-            'recommendations': base_prompt + """Generate specific recommendations for improving this schema markup:
-1. Priority improvements for SEO impact
-2. Changes needed for rich result eligibility
-3. Advanced property implementations
-4. Best practices and optimization tips"""
-        }
-        
-        return prompts.get(analysis_type, base_prompt)
+        base_prompt = _BASE_ANALYSIS_PROMPT.format(schema_data=schema_data)
+        return base_prompt + _ANALYSIS_INSTRUCTIONS.get(analysis_type, '')
 
     @backoff.on_exception(
         backoff.expo,
@@ -93,7 +95,7 @@ Focus on the following aspects:
                 return response.text
             return "No response generated from the model"
         except Exception as e:
-            logger.error(f"Gemini API request failed: {type(e).__name__} - {str(e)}")
+            logger.error("Gemini API request failed: %s - %s", type(e).__name__, e)
             raise
         
     @lru_cache(maxsize=100)
@@ -192,7 +194,7 @@ Focus on the following aspects:
             return validation_results
             
         except Exception as e:
-            logger.error(f"JSON-LD validation error: {type(e).__name__} - {str(e)}")
+            logger.error("JSON-LD validation error: %s - %s", type(e).__name__, e)
             return {
                 'is_valid': False,
                 'errors': [f"Validation error: {type(e).__name__} - {str(e)}"],
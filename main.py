@@ -1,17 +1,44 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import time
+import html
+import json
 import logging
-from typing import Dict, List, Any, Optional
-from schema_analyzer import SchemaAnalyzer
-from competitor_analyzer import CompetitorAnalyzer
-from schema_validator import SchemaValidator
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Any, Optional, Tuple
+from utils import schema_cache_key
+
+# The analyzers pull in requests, BeautifulSoup and the Gemini SDK; they are
+# imported where used so the first page render does not pay for them.
+if TYPE_CHECKING:
+    from gpt_schema_analyzer import GPTSchemaAnalyzer
 
 # Configure logging
-logging.basicConfig(level=logging.INFO)
+if not logging.getLogger().handlers:
+    logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+_SEVERITY_ICONS = {
+    "error": "🚫",
+    "warning": "⚠️",
+    "info": "ℹ️"
+}
+
+_SUMMARY_METRICS = (
+    ("Good Implementations", 'good_schemas', "Number of well-implemented schemas"),
+    ("Needs Improvement", 'needs_improvement', "Number of schemas requiring updates"),
+    ("Suggested Additions", 'suggested_additions', "Number of recommended new schemas")
+)
+
+_RESULT_VIEWS = ("🔍 Schema Analysis", "📊 Competitor Insights")
+
+@st.cache_data(show_spinner=False)
+def load_css(path: str) -> str:
+    """Read a stylesheet from disk, returning an empty string if it is missing"""
+    css_path = Path(path)
+    return css_path.read_text() if css_path.exists() else ''
+
 def initialize_app() -> bool:
     """Initialize the Streamlit application with required settings."""
     try:
@@ -20,154 +47,403 @@ def initialize_app() -> bool:
             page_icon="🚂",
             layout="wide"
         )
+        css = load_css('assets/styles.css')
+        st.markdown(f"<style>{css}</style>", unsafe_allow_html=True)
         return True
     except Exception as e:
-        logger.error(f"Error initializing app: {str(e)}")
+        logger.error("Error initializing app: %s", e)
         st.error(f"Error initializing application: {str(e)}")
         return False
 
-def get_doc_url(row: pd.Series, column: str) -> Optional[str]:
-    """Get documentation URL from DataFrame row"""
-    try:
-        return row[column].iloc[0] if column in row else None
-    except Exception:
-        return None
+@st.cache_data(show_spinner=False)
+def load_schema_types(path: str = 'supported_schema.csv') -> pd.DataFrame:
+    """Load the supported schema types table, parsed once and shared across reruns"""
+    return pd.read_csv(path)
 
-def display_schema_documentation_links(schema_type: str, schema_types_df: pd.DataFrame):
-    """Display documentation links for a schema type"""
-    try:
-        schema_row = schema_types_df[schema_types_df['Name'] == schema_type]
-        if not schema_row.empty:
-            col1, col2 = st.columns(2)
-            with col1:
-                google_url = get_doc_url(schema_row, 'Google Doc URL')
-                if google_url:
-                    st.markdown(f"[📚 Google Developers Guide]({google_url})")
-            with col2:
-                schema_url = get_doc_url(schema_row, 'Schema URL')
-                if schema_url:
-                    st.markdown(f"[🔗 Schema.org Reference]({schema_url})")
-    except Exception as e:
-        logger.error(f"Error displaying documentation links: {str(e)}")
+@st.cache_data(show_spinner=False)
+def build_schema_url_index(path: str = 'supported_schema.csv') -> Dict[str, Tuple[Optional[str], Optional[str]]]:
+    """Map each schema type name to its (Google doc URL, Schema.org URL) pair
+
+    Keyed on the CSV path rather than the DataFrame so reruns skip hashing the table.
+    """
+    # The CSV repeats some names; keep the first row for each, as the original .iloc[0] lookup did
+    schema_types_df = load_schema_types(path).drop_duplicates('Name')
+    # NaN cells become None; columns missing from the CSV yield no URLs at all
+    urls = schema_types_df.reindex(columns=['Google Doc URL', 'Schema URL'])
+    urls = urls.astype(object).where(urls.notna(), None)
+    return dict(zip(
+        schema_types_df['Name'],
+        zip(urls['Google Doc URL'], urls['Schema URL'])
+    ))
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def cached_analyze_competitors(keyword: str, _progress_callback=None) -> Dict[str, Any]:
+    """Analyze competitor schema for a keyword, reusing recent results for the same keyword
+
+    The progress callback is excluded from the cache key and only fires on a cache miss.
+    """
+    from competitor_analyzer import CompetitorAnalyzer
+
+    return CompetitorAnalyzer(keyword).analyze_competitors(progress_callback=_progress_callback)
+
+@st.cache_resource(show_spinner=False)
+def get_gpt_analyzer() -> 'GPTSchemaAnalyzer':
+    """Create the Gemini client once and share it across reruns and sessions"""
+    from gpt_schema_analyzer import GPTSchemaAnalyzer
+
+    return GPTSchemaAnalyzer()
+
+class _UncachedValidation(Exception):
+    """Carries validation results that contain errors out of cached_validate uncached"""
+
+    def __init__(self, validation_results: Dict[str, Any]):
+        super().__init__("Validation completed with errors")
+        self.validation_results = validation_results
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def cached_validate(schema_json_str: str, keyword: str, competitor_key: Optional[str],
+                    _competitor_data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Validate serialized schema data, reusing results for identical inputs
+
+    The keyword and competitor key are part of the cache key because they drive the
+    competitor-based suggestions; competitor_key is the serialized competitor data, or
+    None when the crawl failed and the validator should fetch it itself.
+    """
+    from schema_validator import SchemaValidator
+
+    validator = SchemaValidator(
+        load_schema_types(), keyword, _competitor_data, gpt_analyzer=get_gpt_analyzer()
+    )
+    validation_results = validator.validate_schema(json.loads(schema_json_str))
+    if validation_results.get('errors'):
+        # validate_schema reports failures instead of raising; raise so the
+        # degraded result is not cached and the next run tries again
+        raise _UncachedValidation(validation_results)
+    return validation_results
+
+def render_documentation_links_html(schema_type: str, url_index: Dict[str, Tuple[Optional[str], Optional[str]]]) -> str:
+    """Render documentation links for a schema type as HTML"""
+    google_url, schema_url = url_index.get(schema_type, (None, None))
+    links = []
+    if google_url:
+        links.append(
+            f'<a class="doc-link google" href="{google_url}" target="_blank">'
+            f'<span class="doc-icon">📚</span>Google Developers Guide</a>'
+        )
+    if schema_url:
+        links.append(
+            f'<a class="doc-link schema" href="{schema_url}" target="_blank">'
+            f'<span class="doc-icon">🔗</span>Schema.org Reference</a>'
+        )
+    if not links:
+        return ''
+    return f'<div class="documentation-links">{"".join(links)}</div>'
 
-def display_schema_issues(issues: List[Dict[str, Any]], container=None):
-    """Display schema validation issues with proper formatting in a specified container"""
-    display_target = container if container else st
-    display_target.markdown("### Issues Found")
-    
+def render_issues_html(issues: List[Dict[str, Any]]) -> str:
+    """Render schema validation issues and their suggestions as a single HTML string"""
+    parts = []
     for issue in issues:
         severity = issue.get('severity', 'info')
-        icon_map = {
-            "error": "🚫",
-            "warning": "⚠️",
-            "info": "ℹ️"
-        }
-        icon = icon_map.get(severity, "ℹ️")
-        message = issue.get('message', '')
-        
-        display_target.markdown(
-            f"""<div class="issue-{severity}">
-                {icon} <strong>{severity.title()}</strong>: {message}
-            </div>""",
-            unsafe_allow_html=True
-        )
-        
+        icon = _SEVERITY_ICONS.get(severity, "ℹ️")
+        message = html.escape(str(issue.get('message', '')))
+        parts.append(f'<div class="issue-{severity}">{icon} <strong>{severity.title()}</strong>: {message}</div>')
+
         if suggestion := issue.get('suggestion'):
-            display_target.markdown(
-                f"""<div class="suggestion">
-                    💡 <em>Suggestion</em>: {suggestion}
-                </div>""",
-                unsafe_allow_html=True
-            )
+            parts.append(f'<div class="suggestion">💡 <em>Suggestion</em>: {html.escape(str(suggestion))}</div>')
+
+    return '\n'.join(parts)
+
+def render_schema_card_html(schema: Dict[str, Any], card_type: str, url_index: Dict[str, Tuple[Optional[str], Optional[str]]]) -> str:
+    """Render everything in a schema card except the JSON payload as one HTML string"""
+    parts = [
+        f'<div class="schema-card {card_type}"><h4>Implementation Details</h4></div>',
+        render_documentation_links_html(schema['type'], url_index)
+    ]
+
+    if card_type == 'needs_improvement' and schema.get('issues'):
+        parts.append('<h3>Issues Found</h3>')
+        parts.append(render_issues_html(schema['issues']))
+
+    if 'data' not in schema and 'example_implementation' in schema:
+        parts.append('<h4>Example Implementation</h4>')
 
-def display_schema_card(schema: Dict[str, Any], card_type: str, schema_types_df: pd.DataFrame):
+    return '\n'.join(part for part in parts if part)
+
+def display_schema_card(schema: Dict[str, Any], card_type: str, url_index: Dict[str, Tuple[Optional[str], Optional[str]]],
+                        expanded: bool = False):
     """Display a schema card with consistent styling and expandable content
-    
+
     Args:
         schema: Schema data dictionary
         card_type: Type of card ('good', 'needs_improvement', or 'suggested')
-        schema_types_df: DataFrame containing schema type information
+        url_index: Mapping of schema type to its documentation URLs
+        expanded: Whether the card starts expanded
     """
     icons = {
         'good': '✅',
         'needs_improvement': '⚠️',
         'suggested': '💡'
     }
-    
+
     titles = {
         'good': 'Good Implementation',
         'needs_improvement': 'Needs Improvement',
         'suggested': schema.get('reason', 'Suggested Addition')
     }
-    
+
     icon = icons.get(card_type, '📄')
     title = titles.get(card_type)
-    
-    with st.expander(f"{icon} {schema['type']} ({title})", expanded=False):
-        st.markdown(f"""
-            <div class="schema-card {card_type}">
-                <h4>Implementation Details</h4>
-            </div>
-        """, unsafe_allow_html=True)
-        
-        display_schema_documentation_links(schema['type'], schema_types_df)
-        
-        if card_type == 'needs_improvement' and 'issues' in schema:
-            display_schema_issues(schema['issues'])
-            
+
+    with st.expander(f"{icon} {schema['type']} ({title})", expanded=expanded):
+        st.markdown(render_schema_card_html(schema, card_type, url_index), unsafe_allow_html=True)
+
         if 'data' in schema:
             st.json(schema['data'])
         elif 'example_implementation' in schema:
-            st.markdown("#### Example Implementation")
             st.json(schema['example_implementation'])
 
-def display_schema_recommendations(recommendations: str):
-    """Display schema recommendations with proper formatting"""
-    if not recommendations:
-        return
-        
-    st.markdown("### Recommendations")
-    
-    if isinstance(recommendations, str):
-        # Handle markdown-formatted recommendations
-        if '##' in recommendations:
-            sections = recommendations.split('##')
-            for section in sections:
-                if not section.strip():
-                    continue
-                    
-                lines = section.split('\n')
-                title = lines[0].strip()
-                content = '\n'.join(lines[1:]).strip()
-                
-                if title:
-                    st.markdown(f"#### {title}")
-                
-                if content:
-                    # Check if content contains a table
-                    if '|' in content and '-|-' in content:
-                        # Find table and non-table content
-                        table_lines = []
-                        other_lines = []
-                        
-                        for line in content.split('\n'):
-                            if '|' in line or '-|-' in line:
-                                table_lines.append(line)
-                            elif line.strip():
-                                other_lines.append(line)
-                        
-                        if table_lines:
-                            st.markdown('\n'.join(table_lines))
-                        if other_lines:
-                            st.markdown('\n'.join(other_lines))
-                    else:
-                        st.markdown(content)
-        else:
-            # Handle plain text recommendations
-            st.markdown(recommendations)
+class _ProgressTracker:
+    """Thread-safe progress value reported by worker threads and read by the script thread"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._value = 0.0
+
+    def update(self, value: float):
+        with self._lock:
+            self._value = value
+
+    @property
+    def value(self) -> float:
+        with self._lock:
+            return self._value
+
+def run_analysis(url: str, keyword: str, progress_bar, status_text, error_container) -> Optional[Dict[str, Any]]:
+    """Run schema extraction, competitor analysis and validation for the given inputs
+
+    Returns:
+        Dict with the extracted schema, validation results and competitor insights,
+        or None if validation failed
+    """
+    from competitor_analyzer import CompetitorAnalyzer
+    from schema_analyzer import SchemaAnalyzer
+
+    # Load schema types up front so a bad CSV fails before any network work
+    try:
+        load_schema_types()
+    except Exception as e:
+        logger.error("Failed to load schema types: %s", e)
+        st.error("Failed to load schema types data. Please try again.")
+        return None
+
+    # Initialize analyzers
+    competitor_analyzer = CompetitorAnalyzer(keyword)
+
+    # Extract schema data and analyze competitors concurrently; both are network bound
+    status_text.text("🔍 Analyzing schema markup and competitors...")
+    competitor_progress = _ProgressTracker()
+    competitor_data = None
+    # Not used as a context manager: exiting one would block on the competitor crawl
+    executor = ThreadPoolExecutor(max_workers=2)
+    try:
+        schema_future = executor.submit(SchemaAnalyzer(url).extract_schema)
+        competitor_future = executor.submit(
+            cached_analyze_competitors, keyword, _progress_callback=competitor_progress.update
+        )
+
+        # Worker threads cannot touch Streamlit elements, so poll their progress from here
+        pending = {schema_future, competitor_future}
+        while pending:
+            _, pending = wait(pending, timeout=0.2)
+            if schema_future.done() and schema_future.exception() is not None:
+                # Fail fast when the page itself can't be fetched
+                schema_future.result()
+            progress_bar.progress(0.25 * schema_future.done() + 0.25 * competitor_progress.value)
+
+        schema_data = schema_future.result()
+
+        try:
+            competitor_data = competitor_future.result()
+            competitor_analyzer.competitor_data = competitor_data
+        except Exception as e:
+            logger.error("Error analyzing competitors: %s", e)
+            error_container.error(f"Error analyzing competitors: {str(e)}")
+        progress_bar.progress(0.5)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    # Validate schema, reusing the competitor data collected above
+    status_text.text("✅ Validating schema...")
+    competitor_key = None if competitor_data is None else schema_cache_key(competitor_data)
+    try:
+        validation_results = cached_validate(
+            schema_cache_key(schema_data),
+            keyword,
+            competitor_key,
+            competitor_data
+        )
+    except _UncachedValidation as e:
+        validation_results = e.validation_results
+    except Exception as e:
+        logger.error("Error validating schema: %s", e)
+        error_container.error(f"Error validating schema: {str(e)}")
+        return None
+    progress_bar.progress(0.75)
+
+    if not validation_results:
+        return None
+
+    progress_bar.empty()
+    status_text.empty()
+    st.toast("✨ Analysis complete!")
+
+    return {
+        'schema_data': schema_data,
+        'validation_results': validation_results,
+        'competitor_data': competitor_data or {},
+        'insights': competitor_analyzer.get_competitor_insights()
+    }
+
+@st.cache_resource(show_spinner=False)
+def build_usage_figure(usage: Tuple[Tuple[str, int, float], ...]):
+    """Build the competitor schema usage bar chart from (schema_type, count, percentage) rows
+
+    Cached as a resource so reruns reuse the same Figure instead of unpickling a copy;
+    st.plotly_chart only serialises the figure and never mutates it.
+    """
+    # Imported lazily; plotly is only needed once competitor data is available
+    import plotly.express as px
+
+    df = pd.DataFrame({
+        'schema_type': [schema_type for schema_type, _, _ in usage],
+        'percentage': [percentage for _, _, percentage in usage]
+    })
+    fig = px.bar(df,
+               x='schema_type',
+               y='percentage',
+               title='Schema Usage Across Competitors',
+               labels={'schema_type': 'Schema Type',
+                      'percentage': 'Usage Percentage (%)'},
+               color='percentage',
+               color_continuous_scale='Viridis')
+
+    fig.update_layout(
+        xaxis_tickangle=-45,
+        showlegend=False,
+        height=500
+    )
+    return fig
+
+@st.cache_data(show_spinner=False)
+def build_usage_stats(usage: Tuple[Tuple[str, int, float], ...]) -> pd.DataFrame:
+    """Build the detailed competitor statistics table from (schema_type, count, percentage) rows"""
+    return pd.DataFrame(
+        list(usage),
+        columns=['Schema Type', 'Number of Competitors', 'Usage Percentage (%)']
+    ).round({'Usage Percentage (%)': 1})
+
+@st.cache_data(show_spinner=False)
+def build_comparison_table(usage: Tuple[Tuple[str, int, float], ...], current_types: Tuple[str, ...]) -> pd.DataFrame:
+    """Build the implemented-vs-competitors table from usage rows and the page's schema types"""
+    # Insights carry one row per schema type, so columns can be built directly
+    schema_types = pd.Series([schema_type for schema_type, _, _ in usage], dtype=object)
+    percentages = pd.Series([percentage for _, _, percentage in usage], dtype=float)
+    return pd.DataFrame({
+        'Schema Type': schema_types,
+        'Status': schema_types.isin(current_types).map({True: "✅ Implemented", False: "❌ Missing"}),
+        'Competitor Usage': percentages.map('{:.1f}%'.format)
+    })
+
+@st.fragment
+def display_schema_analysis_tab(results: Dict[str, Any], url_index: Dict[str, Tuple[Optional[str], Optional[str]]]):
+    """Render the schema analysis tab; widget changes inside it rerun only this fragment"""
+    validation_results = results['validation_results']
+
+    # Summary metrics
+    for col, (title, key, help_text) in zip(st.columns(len(_SUMMARY_METRICS)), _SUMMARY_METRICS):
+        col.metric(title, len(validation_results.get(key, [])), help=help_text)
+
+    # Schema sections with consistent styling
+    sections = [
+        ("✅ Good Implementations", 'good_schemas', 'good'),
+        ("⚠️ Needs Improvement", 'needs_improvement', 'needs_improvement'),
+        ("💡 Suggested Additions", 'suggested_additions', 'suggested')
+    ]
+
+    entries = [
+        (section_title, card_type, schema)
+        for section_title, section_key, card_type in sections
+        for schema in validation_results.get(section_key, [])
+    ]
+
+    if entries:
+        # One summary table for every schema; details are rendered only for the selected one
+        st.markdown("### Schema Overview")
+        st.dataframe(
+            pd.DataFrame({
+                'Schema Type': [schema['type'] for _, _, schema in entries],
+                'Status': [section_title for section_title, _, _ in entries],
+                'Issues': [len(schema.get('issues', [])) for _, _, schema in entries]
+            }),
+            use_container_width=True,
+            hide_index=True
+        )
+
+        selected = st.selectbox(
+            "Schema details",
+            range(len(entries)),
+            format_func=lambda i: f"{entries[i][2]['type']} ({entries[i][0]})",
+            key=f"schema_detail_{results.get('key')}"
+        )
+        _, card_type, schema = entries[selected]
+        display_schema_card(schema, card_type, url_index, expanded=True)
+
+@st.fragment
+def display_competitor_tab(results: Dict[str, Any]):
+    """Render the competitor insights tab as an independently rerunning fragment"""
+    schema_data = results['schema_data']
+    insights = results['insights']
+
+    st.subheader("📊 Schema Implementation Comparison")
+
+    # Create visualization data
+    if insights:
+        usage = tuple((i['schema_type'], i['count'], i['percentage']) for i in insights)
+
+        # Bar chart for schema usage
+        fig = build_usage_figure(usage)
+        st.plotly_chart(fig, use_container_width=True)
+
+        # Detailed statistics table
+        st.subheader("📈 Detailed Statistics")
+        st.dataframe(build_usage_stats(usage), use_container_width=True)
+
+        # Current implementation comparison
+        if schema_data:
+            st.subheader("🔄 Your Implementation vs Competitors")
+            comparison_df = build_comparison_table(usage, tuple(sorted(schema_data)))
+            st.dataframe(comparison_df, use_container_width=True)
+    else:
+        st.info("No competitor data available for comparison")
+
+def display_analysis_results(results: Dict[str, Any], url_index: Dict[str, Tuple[Optional[str], Optional[str]]]):
+    """Render the analysis and competitor tabs for a completed analysis run"""
+    if not results['schema_data']:
+        st.warning("No schema markup found on the page")
+
+    # A radio acts as the tab bar so only the visible view is built; st.tabs runs both
+    view = st.radio(
+        "View",
+        _RESULT_VIEWS,
+        horizontal=True,
+        label_visibility="collapsed",
+        key="results_view"
+    )
+
+    if view == _RESULT_VIEWS[0]:
+        display_schema_analysis_tab(results, url_index)
     else:
-        # Handle non-string recommendations (e.g., dict or list)
-        st.json(recommendations)
+        display_competitor_tab(results)
 
 def main():
     """Main application function with enhanced error handling"""
@@ -183,29 +459,6 @@ def main():
         Get recommendations for improvements and ensure compliance with schema.org standards.
         """)
 
-        # Add form styling
-        st.markdown('''
-            <style>
-                div[data-testid="stForm"] {
-                    background: white;
-                    border-radius: 8px;
-                    padding: 1.5rem;
-                    margin: 1rem 0;
-                    box-shadow: none;
-                }
-                
-                /* Remove any duplicate containers */
-                div.url-input-form {
-                    display: none;
-                }
-                
-                /* Clean up form spacing */
-                div[data-testid="stForm"] > div:first-child {
-                    margin-top: 0;
-                }
-            </style>
-        ''', unsafe_allow_html=True)
-
         with st.form("url_input"):
             st.markdown("### Enter URL and Keyword")
             
@@ -233,22 +486,6 @@ def main():
                     help="Click to analyze schema markup and get recommendations"
                 )
 
-            # Add minimal CSS just for button styling
-            st.markdown('''
-                <style>
-                div.stButton > button {
-                    background: linear-gradient(45deg, #2979ff, #1565c0);
-                    color: white;
-                    border-radius: 24px;
-                    border: none;
-                    font-weight: 600;
-                    text-transform: uppercase;
-                    letter-spacing: 1.2px;
-                    padding: 0.75rem 2.5rem;
-                }
-                </style>
-            ''', unsafe_allow_html=True)
-
         if submitted:
             if not url:
                 st.error("Please enter a valid URL")
@@ -257,160 +494,40 @@ def main():
                 st.error("Please enter a target keyword")
                 return
 
-            # Initialize progress components
-            progress_bar = st.progress(0)
-            status_text = st.empty()
-            error_container = st.empty()
-
-            try:
-                # Load schema types
-                try:
-                    schema_types_df = pd.read_csv('supported_schema.csv')
-                except Exception as e:
-                    logger.error(f"Failed to load schema types: {str(e)}")
-                    st.error("Failed to load schema types data. Please try again.")
-                    return
-
-                # Initialize analyzers
-                schema_analyzer = SchemaAnalyzer(url)
-                competitor_analyzer = CompetitorAnalyzer(keyword)
-                schema_validator = SchemaValidator(schema_types_df, keyword)
+            # Reuse the previous run when the inputs have not changed
+            last_run = st.session_state.get('last_run')
+            if not last_run or last_run['key'] != (url, keyword):
+                st.session_state.pop('last_run', None)
 
-                # Extract schema data
-                status_text.text("🔍 Analyzing schema markup...")
-                schema_data = schema_analyzer.extract_schema()
-                progress_bar.progress(0.25)
+                # Initialize progress components
+                progress_bar = st.progress(0)
+                status_text = st.empty()
+                error_container = st.empty()
 
-                # Analyze competitors
-                status_text.text("🔄 Analyzing competitors...")
-                competitor_data = {}
                 try:
-                    competitor_data = competitor_analyzer.analyze_competitors(
-                        progress_callback=lambda p: progress_bar.progress(0.25 + p * 0.25)
-                    )
+                    results = run_analysis(url, keyword, progress_bar, status_text, error_container)
                 except Exception as e:
-                    logger.error(f"Error analyzing competitors: {str(e)}")
-                    error_container.error(f"Error analyzing competitors: {str(e)}")
-
-                # Validate schema
-                status_text.text("✅ Validating schema...")
-                validation_results = None
-                try:
-                    validation_results = schema_validator.validate_schema(schema_data)
-                    progress_bar.progress(0.75)
-                    if not schema_data:
-                        st.warning("No schema markup found on the page")
-                except Exception as e:
-                    logger.error(f"Error validating schema: {str(e)}")
-                    error_container.error(f"Error validating schema: {str(e)}")
+                    logger.error("Error in analysis: %s", e)
+                    error_container.error(f"Error in analysis: {str(e)}")
                     return
 
-                # Display results
-                if validation_results:
-                    progress_bar.progress(1.0)
-                    status_text.text("✨ Analysis complete!")
-                    time.sleep(1)
-                    progress_bar.empty()
-                    status_text.empty()
-
-                    # Display results in tabs
-                    analysis_tab, competitor_tab = st.tabs([
-                        "🔍 Schema Analysis",
-                        "📊 Competitor Insights"
-                    ])
-
-                    with analysis_tab:
-                        # Summary metrics
-                        col1, col2, col3 = st.columns(3)
-                        metrics = [
-                            ("Good Implementations", 'good_schemas', "Number of well-implemented schemas"),
-                            ("Needs Improvement", 'needs_improvement', "Number of schemas requiring updates"),
-                            ("Suggested Additions", 'suggested_additions', "Number of recommended new schemas")
-                        ]
-                        
-                        for (title, key, help_text), col in zip(metrics, [col1, col2, col3]):
-                            with col:
-                                st.metric(
-                                    title,
-                                    len(validation_results.get(key, [])),
-                                    help=help_text
-                                )
-
-                        # Schema sections with consistent styling
-                        sections = [
-                            ("✅ Good Implementations", 'good_schemas', 'good'),
-                            ("⚠️ Needs Improvement", 'needs_improvement', 'needs_improvement'),
-                            ("💡 Suggested Additions", 'suggested_additions', 'suggested')
-                        ]
-                        
-                        for section_title, section_key, card_type in sections:
-                            if schemas := validation_results.get(section_key):
-                                st.markdown(f"### {section_title}")
-                                for schema in schemas:
-                                    display_schema_card(schema, card_type, schema_types_df)
-
-                    with competitor_tab:
-                        st.subheader("📊 Schema Implementation Comparison")
-                        
-                        # Get competitor insights
-                        insights = competitor_analyzer.get_competitor_insights()
-                        
-                        # Create visualization data
-                        if insights:
-                            df = pd.DataFrame(insights)
-                            
-                            # Bar chart for schema usage
-                            fig = px.bar(df, 
-                                       x='schema_type', 
-                                       y='percentage',
-                                       title='Schema Usage Across Competitors',
-                                       labels={'schema_type': 'Schema Type', 
-                                              'percentage': 'Usage Percentage (%)'},
-                                       color='percentage',
-                                       color_continuous_scale='Viridis')
-                            
-                            fig.update_layout(
-                                xaxis_tickangle=-45,
-                                showlegend=False,
-                                height=500
-                            )
-                            
-                            st.plotly_chart(fig, use_container_width=True)
-                            
-                            # Detailed statistics table
-                            st.subheader("📈 Detailed Statistics")
-                            stats_df = df[['schema_type', 'count', 'percentage']].copy()
-                            stats_df.columns = ['Schema Type', 'Number of Competitors', 'Usage Percentage (%)']
-                            stats_df['Usage Percentage (%)'] = stats_df['Usage Percentage (%)'].round(1)
-                            st.dataframe(stats_df, use_container_width=True)
-                            
-                            # Current implementation comparison
-                            if schema_data:
-                                st.subheader("🔄 Your Implementation vs Competitors")
-                                current_types = set(schema_data.keys())
-                                comparison_data = []
-                                
-                                for schema_type in set(df['schema_type']):
-                                    competitor_usage = df[df['schema_type'] == schema_type]['percentage'].iloc[0]
-                                    status = "✅ Implemented" if schema_type in current_types else "❌ Missing"
-                                    comparison_data.append({
-                                        'Schema Type': schema_type,
-                                        'Status': status,
-                                        'Competitor Usage': f"{competitor_usage:.1f}%"
-                                    })
-                                
-                                comparison_df = pd.DataFrame(comparison_data)
-                                st.dataframe(comparison_df, use_container_width=True)
-                        else:
-                            st.info("No competitor data available for comparison")
+                if results is None:
+                    return
+                st.session_state['last_run'] = {'key': (url, keyword), **results}
 
+        if last_run := st.session_state.get('last_run'):
+            # Load schema types
+            try:
+                url_index = build_schema_url_index()
             except Exception as e:
-                logger.error(f"Error in analysis: {str(e)}")
-                error_container.error(f"Error in analysis: {str(e)}")
+                logger.error("Failed to load schema types: %s", e)
+                st.error("Failed to load schema types data. Please try again.")
                 return
 
+            display_analysis_results(last_run, url_index)
+
     except Exception as e:
-        logger.error(f"Application error: {str(e)}")
+        logger.error("Application error: %s", e)
         st.error(f"Application error: {str(e)}")
 
 if __name__ == "__main__":
@@ -1,7 +1,105 @@
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from bs4 import BeautifulSoup, SoupStrainer
 import json
 import re
+from typing import Any, Dict, Optional
+
+import streamlit as st
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+# Only JSON-LD script tags are needed, so the parser skips building the rest of the DOM
+_LD_JSON_STRAINER = SoupStrainer('script', attrs={'type': 'application/ld+json'})
+
+# Pooled connections shared by every SchemaAnalyzer, including concurrent competitor fetches
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_maxsize=16))
+_SESSION.mount('http://', HTTPAdapter(pool_maxsize=16))
+
+_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+    # Includes br only when a brotli decoder is installed, so responses can always be decoded
+    'Accept-Encoding': ACCEPT_ENCODING,
+}
+
+# (connect, read) seconds; keeps a stalled site from blocking the Streamlit script
+_TIMEOUT = (3.05, 10)
+
+# Pages are read up to this many bytes; anything past it is unlikely to hold JSON-LD
+_MAX_CONTENT_BYTES = 2 * 1024 * 1024
+_CHUNK_SIZE = 16 * 1024
+
+def _loads(text: str):
+    """Parse a JSON-LD payload, preferring orjson when it is installed"""
+    if orjson is not None:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch either
+        return orjson.loads(text)
+    return json.loads(text)
+
+def _read_capped(response: requests.Response) -> bytes:
+    """Read a streamed response body, stopping once _MAX_CONTENT_BYTES have arrived"""
+    chunks = []
+    received = 0
+    for chunk in response.iter_content(chunk_size=_CHUNK_SIZE):
+        chunks.append(chunk)
+        received += len(chunk)
+        if received >= _MAX_CONTENT_BYTES:
+            break
+    return b''.join(chunks)
+
+@st.cache_data(ttl=3600, max_entries=1024, show_spinner=False)
+def fetch_schema(url: str, _user_agent: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Fetch a page and extract its JSON-LD schema markup, keyed by URL.
+
+    Results are shared across sessions for an hour, since popular keywords keep
+    returning the same competitor pages. Request errors propagate unchanged so
+    callers can retry on them.
+
+    Args:
+        url: Page to fetch
+        _user_agent: Optional User-Agent override; not part of the cache key
+    """
+    headers = _HEADERS if _user_agent is None else {**_HEADERS, 'User-Agent': _user_agent}
+    with _SESSION.get(url, headers=headers, timeout=_TIMEOUT, stream=True) as response:
+        response.raise_for_status()
+        content = _read_capped(response)
+
+    soup = BeautifulSoup(content, 'lxml', parse_only=_LD_JSON_STRAINER)
+
+    # Find all script tags with type application/ld+json
+    schema_tags = soup.find_all('script', type='application/ld+json')
+
+    schema_data = {}
+
+    for tag in schema_tags:
+        try:
+            data = _loads(tag.get_text())
+            if isinstance(data, dict) and '@type' in data:
+                schema_type = data.get('@type')
+                if schema_type:
+                    schema_data[schema_type] = data
+            # Added @graph parsing
+            elif isinstance(data, dict) and '@graph' in data:
+                for item in data['@graph']:
+                    schema_type = item.get('@type')
+                    if schema_type:
+                        schema_data[schema_type] = item    
+            elif isinstance(data, list):
+                for item in data:
+                    if isinstance(item, dict):
+                        schema_type = item.get('@type')
+                        if schema_type:
+                            schema_data[schema_type] = item
+        except json.JSONDecodeError:
+            continue
+
+    return schema_data
 
 class SchemaAnalyzer:
     def __init__(self, url):
@@ -10,43 +108,6 @@ class SchemaAnalyzer:
     def extract_schema(self):
         """Extract schema markup from the given URL"""
         try:
-            # Fetch URL content
-            response = requests.get(self.url, headers={
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            })
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Find all script tags with type application/ld+json
-            schema_tags = soup.find_all('script', type='application/ld+json')
-            
-            schema_data = {}
-            
-            for tag in schema_tags:
-                try:
-                    data = json.loads(tag.string)
-                    if isinstance(data, dict) and '@type' in data:
-                        schema_type = data.get('@type')
-                        if schema_type:
-                            schema_data[schema_type] = data
-                    # Added @graph parsing
-                    elif isinstance(data, dict) and '@graph' in data:
-                        for item in data['@graph']:
-                            schema_type = item.get('@type')
-                            if schema_type:
-                                schema_data[schema_type] = item    
-                    elif isinstance(data, list):
-                        for item in data:
-                            print(item)
-                            if isinstance(item, dict):
-                                schema_type = item.get('@type')
-                                if schema_type:
-                                    schema_data[schema_type] = item
-                except json.JSONDecodeError:
-                    continue
-                    
-            return schema_data
-            
+            return fetch_schema(self.url)
         except requests.RequestException as e:
             raise Exception(f"Error fetching URL: {str(e)}")
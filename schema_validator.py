@@ -5,6 +5,7 @@ from gpt_schema_analyzer import GPTSchemaAnalyzer
 from competitor_analyzer import CompetitorAnalyzer
 import logging
 import json
+from collections import Counter
 import urllib.parse
 from utils import clean_schema_type
 from typing import Dict, Any, Optional, List, Union
@@ -14,24 +15,34 @@ from validators.base_validator import BaseValidator
 from validators.schema_org_validator import SchemaOrgValidator
 
 # Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+@st.cache_data(ttl=3600, show_spinner=False)
+def _competitor_data_for(keyword: str) -> Dict[str, Any]:
+    """Crawl competitor schema data for a keyword, shared across reruns and validators"""
+    return CompetitorAnalyzer(keyword).analyze_competitors()
+
 class SchemaValidator(BaseValidator):
     """Main schema validator class that coordinates different validation strategies."""
 
-    def __init__(self, schema_types_df, keyword: Optional[str] = None):
+    def __init__(self, schema_types_df, keyword: Optional[str] = None,
+                 competitor_data: Optional[Dict[str, Any]] = None,
+                 gpt_analyzer: Optional[GPTSchemaAnalyzer] = None):
         """
         Initialize SchemaValidator with necessary components.
         
         Args:
             schema_types_df: DataFrame containing schema type information
             keyword: Optional keyword for competitor analysis
+            competitor_data: Optional competitor schema data already collected for
+                the keyword; when omitted it is fetched on demand
+            gpt_analyzer: Optional shared GPTSchemaAnalyzer; a new one is created if omitted
         """
         super().__init__(schema_types_df)
-        self.gpt_analyzer = GPTSchemaAnalyzer()
+        self.gpt_analyzer = gpt_analyzer or GPTSchemaAnalyzer()
         self.schema_org_validator = SchemaOrgValidator(schema_types_df)
         self.keyword = keyword
+        self.competitor_data = competitor_data
 
     def validate_schema(self, current_schema: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -65,8 +76,11 @@ class SchemaValidator(BaseValidator):
                     validation_results['suggested_additions'] = competitor_recommendations
                 return validation_results
 
+            # Validate every type in one batch so the validator round trips overlap
+            batch_results = self.schema_org_validator.validate_batch(list(current_schema.values()))
+
             # Process each schema type
-            for schema_type, schema_data in current_schema.items():
+            for (schema_type, schema_data), schema_validation in zip(current_schema.items(), batch_results):
                 try:
                     validation_entry = {
                         'type': schema_type,
@@ -75,7 +89,8 @@ class SchemaValidator(BaseValidator):
                     }
 
                     # Validate using Schema.org validator
-                    schema_validation = self.schema_org_validator.validate_schema(schema_data)
+                    if isinstance(schema_validation, Exception):
+                        raise schema_validation
                     
                     if schema_validation['errors']:
                         validation_entry['issues'].extend([
@@ -96,7 +111,7 @@ class SchemaValidator(BaseValidator):
                     validation_results['all_types'].append(schema_type)
 
                 except Exception as e:
-                    logger.error(f"Error validating schema {schema_type}: {str(e)}")
+                    logger.error("Error validating schema %s: %s", schema_type, e)
                     validation_results['errors'].append({
                         'severity': 'error',
                         'message': f'Validation error for {schema_type}: {str(e)}'
@@ -105,7 +120,7 @@ class SchemaValidator(BaseValidator):
             # Add competitor-based recommendations
             competitor_suggestions = self._get_competitor_recommendations()
             if competitor_suggestions:
-                current_types = set(schema_type for schema_type in current_schema.keys())
+                current_types = set(current_schema)
                 for suggestion in competitor_suggestions:
                     if suggestion['type'] not in current_types:
                         validation_results['suggested_additions'].append(suggestion)
@@ -113,7 +128,7 @@ class SchemaValidator(BaseValidator):
             return validation_results
 
         except Exception as e:
-            logger.error(f"Error in schema validation: {str(e)}")
+            logger.error("Error in schema validation: %s", e)
             return {
                 'good_schemas': [],
                 'needs_improvement': [],
@@ -122,27 +137,31 @@ class SchemaValidator(BaseValidator):
                 'warnings': []
             }
 
+    def _competitors(self) -> Dict[str, Any]:
+        """Return competitor schema data for the keyword, crawling at most once per validator"""
+        if self.competitor_data is None:
+            self.competitor_data = _competitor_data_for(self.keyword)
+        return self.competitor_data
+
     def _get_competitor_recommendations(self) -> List[Dict[str, Any]]:
         """Get schema recommendations based on competitor analysis."""
         try:
             if not self.keyword:
                 return []
-                
-            competitor_analyzer = CompetitorAnalyzer(self.keyword)
-            competitor_data = competitor_analyzer.analyze_competitors()
+
+            competitor_data = self._competitors()
             
-            type_counts = {}
+            type_counts = Counter()
             type_examples = {}
             for url, schemas in competitor_data.items():
+                type_counts.update(schemas.keys())
                 for schema_type, schema_content in schemas.items():
-                    if schema_type not in type_counts:
-                        type_counts[schema_type] = 0
-                        type_examples[schema_type] = schema_content
-                    type_counts[schema_type] += 1
+                    type_examples.setdefault(schema_type, schema_content)
             
             recommendations = []
             
-            for schema_type, count in type_counts.items():
+            # most_common() already yields types by descending count
+            for schema_type, count in type_counts.most_common():
                 if count > 1:  # Only recommend types used by multiple competitors
                     recommendation = {
                         'type': schema_type,
@@ -152,15 +171,15 @@ class SchemaValidator(BaseValidator):
                     }
                     
                     # Add schema type information if available
-                    schema_info = self.schema_types_df[self.schema_types_df['Name'] == schema_type]
-                    if not schema_info.empty:
-                        recommendation['schema_description'] = schema_info['Description'].iloc[0]
-                        recommendation['schema_url'] = schema_info['Schema URL'].iloc[0]
+                    schema_info = self._types_by_name.get(schema_type)
+                    if schema_info is not None:
+                        recommendation['schema_description'] = schema_info['Description']
+                        recommendation['schema_url'] = schema_info['Schema URL']
                     
                     recommendations.append(recommendation)
             
-            return sorted(recommendations, key=lambda x: x['priority'], reverse=True)
+            return recommendations
             
         except Exception as e:
-            logger.error(f"Error in competitor recommendations: {str(e)}")
+            logger.error("Error in competitor recommendations: %s", e)
             return []
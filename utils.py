@@ -2,6 +2,15 @@ import requests
 from typing import Dict, List, Any
 import json
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+# Built once; json.dumps would construct a new encoder on every call with these options
+_DISPLAY_ENCODER = json.JSONEncoder(indent=2, ensure_ascii=False, default=str)
+_CACHE_KEY_ENCODER = json.JSONEncoder(sort_keys=True, default=str)
+
 def fetch_url_content(url: str) -> str:
     """Fetch content from URL with error handling"""
     try:
@@ -15,7 +24,22 @@ def fetch_url_content(url: str) -> str:
 
 def format_schema_data(schema_data: Dict) -> str:
     """Format schema data for display"""
-    return json.dumps(schema_data, indent=2)
+    if orjson is not None:
+        try:
+            return orjson.dumps(schema_data, option=orjson.OPT_INDENT_2, default=str).decode()
+        except orjson.JSONEncodeError:
+            # e.g. non-string keys or integers beyond 64 bits; stdlib json handles these
+            pass
+    return _DISPLAY_ENCODER.encode(schema_data)
+
+def schema_cache_key(schema_data: Any) -> str:
+    """Serialize schema data deterministically for use as a cache key"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(schema_data, option=orjson.OPT_SORT_KEYS, default=str).decode()
+        except orjson.JSONEncodeError:
+            pass
+    return _CACHE_KEY_ENCODER.encode(schema_data)
 
 def clean_schema_type(schema_type: str) -> str:
     """Clean and normalize schema type strings"""
@@ -7,6 +7,17 @@ logger = logging.getLogger(__name__)
 class BaseValidator:
     def __init__(self, schema_types_df=None):
         self.schema_types_df = schema_types_df
+        self._types_by_name = self._build_type_index(schema_types_df)
+
+    @staticmethod
+    def _build_type_index(schema_types_df) -> Dict[str, Dict[str, Any]]:
+        """Index schema type rows by Name; the first row wins for duplicated names."""
+        if schema_types_df is None:
+            return {}
+
+        rows = schema_types_df.drop_duplicates('Name')
+        columns = rows.reindex(columns=['Description', 'Schema URL', 'Google Doc URL'])
+        return dict(zip(rows['Name'], columns.to_dict('records')))
 
     def validate_schema_structure(self, schema_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -60,18 +71,15 @@ class BaseValidator:
         Returns:
             Dict containing schema type information or None if not found
         """
-        if self.schema_types_df is None:
-            return None
-
-        schema_info = self.schema_types_df[self.schema_types_df['Name'] == schema_type]
-        if schema_info.empty:
+        schema_info = self._types_by_name.get(schema_type)
+        if schema_info is None:
             return None
 
         return {
             'name': schema_type,
-            'description': schema_info['Description'].iloc[0],
-            'url': schema_info['Schema URL'].iloc[0],
-            'google_url': schema_info['Google Doc URL'].iloc[0] if 'Google Doc URL' in schema_info else None
+            'description': schema_info['Description'],
+            'url': schema_info['Schema URL'],
+            'google_url': schema_info['Google Doc URL']
         }
 
     def format_validation_message(self, message_type: str, message: str, suggestion: Optional[str] = None) -> Dict[str, Any]:
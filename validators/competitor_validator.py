@@ -1,4 +1,5 @@
 from .base_validator import BaseValidator
+from collections import Counter
 from typing import Dict, List, Any
 import logging
 
@@ -11,12 +12,10 @@ class CompetitorValidator(BaseValidator):
 
     def get_competitor_recommendations(self, competitor_types: List[str]) -> List[Dict[str, Any]]:
         try:
-            type_counts = {}
-            for schema_type in competitor_types:
-                type_counts[schema_type] = competitor_types.count(schema_type)
+            type_counts = Counter(competitor_types)
             
             recommendations = []
-            for schema_type, count in type_counts.items():
+            for schema_type, count in type_counts.most_common():
                 if count > 1:
                     recommendations.append({
                         'type': schema_type,
@@ -24,8 +23,8 @@ class CompetitorValidator(BaseValidator):
                         'recommendations': self.gpt_analyzer.generate_property_recommendations(schema_type)
                     })
             
-            return sorted(recommendations, key=lambda x: int(x['reason'].split()[2]), reverse=True)
+            return recommendations
             
         except Exception as e:
-            logger.error(f"Error in competitor recommendations: {str(e)}")
+            logger.error("Error in competitor recommendations: %s", e)
             return []
@@ -1,11 +1,29 @@
-from typing import Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Tuple, Union
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import logging
+import threading
+import time
 from .base_validator import BaseValidator
 
 logger = logging.getLogger(__name__)
 
+# Keeps the validator connection alive across the concurrent per-type requests
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_connections=16, pool_maxsize=16))
+
+# Upper bound on concurrent validator requests issued by validate_batch
+_MAX_BATCH_WORKERS = 8
+
+# Parsed validator responses by URL, shared by all instances: url -> (fetched_at, response)
+_RESPONSE_CACHE: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+_RESPONSE_CACHE_LOCK = threading.Lock()
+_RESPONSE_CACHE_TTL = 24 * 60 * 60
+# One lock per URL so concurrent requests for the same payload share a single fetch
+_URL_LOCKS: Dict[str, threading.Lock] = {}
+
 class SchemaOrgValidator(BaseValidator):
     """Handles Schema.org specific validation logic."""
     
@@ -29,8 +47,29 @@ class SchemaOrgValidator(BaseValidator):
         Returns:
             Dict containing validation results
         """
+        if not isinstance(url, str):
+            # JSON-LD allows list or object @context values; those are unhashable, so skip the cache
+            return self._post_to_validator(url)
+
+        with _RESPONSE_CACHE_LOCK:
+            url_lock = _URL_LOCKS.setdefault(url, threading.Lock())
+
+        with url_lock:
+            with _RESPONSE_CACHE_LOCK:
+                cached = _RESPONSE_CACHE.get(url)
+            if cached is not None and time.monotonic() - cached[0] < _RESPONSE_CACHE_TTL:
+                return cached[1]
+
+            validation_data = self._post_to_validator(url)
+
+            with _RESPONSE_CACHE_LOCK:
+                _RESPONSE_CACHE[url] = (time.monotonic(), validation_data)
+            return validation_data
+
+    def _post_to_validator(self, url: str) -> Dict[str, Any]:
+        """Submit a URL to the Schema.org validator and parse its response."""
         try:
-            response = requests.post(
+            response = _SESSION.post(
                 self.SCHEMA_VALIDATOR_ENDPOINT,
                 data={"url": url},
                 headers=self.headers,
@@ -43,7 +82,7 @@ class SchemaOrgValidator(BaseValidator):
             logger.error("Schema.org validator request timed out")
             raise Exception("Schema.org validator request timed out. Please try again.")
         except requests.RequestException as e:
-            logger.error(f"Error accessing Schema.org validator: {str(e)}")
+            logger.error("Error accessing Schema.org validator: %s", e)
             raise Exception(f"Error accessing Schema.org validator: {str(e)}")
 
     def validate_schema(self, schema_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -66,9 +105,37 @@ class SchemaOrgValidator(BaseValidator):
             validation_data = self.validate_url(schema_data['@context'])
             return self._extract_validation_details(validation_data)
         except Exception as e:
-            logger.error(f"Schema validation error: {str(e)}")
+            logger.error("Schema validation error: %s", e)
             raise
 
+    def validate_batch(self, schemas: List[Dict[str, Any]]) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Validate several schemas, issuing their validator requests concurrently.
+
+        The validator accepts one URL per request, so the batch fans out over a small
+        thread pool; identical requests are only sent once (see validate_url).
+
+        Args:
+            schemas: The schema data items to validate
+
+        Returns:
+            One entry per input, in order: the validation results, or the exception
+            raised while validating that item
+        """
+        if not schemas:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(_MAX_BATCH_WORKERS, len(schemas))) as executor:
+            futures = [executor.submit(self.validate_schema, schema_data) for schema_data in schemas]
+
+        results = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                results.append(e)
+        return results
+
     def _process_validator_response(self, response_text: str) -> Dict[str, Any]:
         """Process and parse Schema.org validator response."""
         try:
@@ -78,7 +145,7 @@ class SchemaOrgValidator(BaseValidator):
 
             return json.loads(response_text)
         except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON response from Schema.org validator: {str(e)}")
+            logger.error("Invalid JSON response from Schema.org validator: %s", e)
             raise Exception(f"Invalid response format from Schema.org validator: {str(e)}")
 
     def _extract_validation_details(self, data: Dict[str, Any]) -> Dict[str, Any]:
@@ -133,5 +200,5 @@ class SchemaOrgValidator(BaseValidator):
             
             return validation_details
         except Exception as e:
-            logger.error(f"Error extracting validation details: {str(e)}")
+            logger.error("Error extracting validation details: %s", e)
             raise Exception(f"Error processing validation details: {str(e)}")